@@ -146,6 +146,7 @@ public:
 
 private:
   static void taskEntry(void* arg);
+  void wakeTask();
   void taskLoop();
   bool connectCaster(const NtripClientConfig& cfg);
   bool connectCasterWithVersion(const NtripClientConfig& cfg,
@@ -159,6 +160,8 @@ private:
   WiFiClient client;
   Print* gnssOutput = nullptr;
   NtripClientConfig config;
+  String requestRev2;  // Prebuilt request header blocks, built once in begin()
+  String requestRev1;
 
   // Volatile scalars — written by taskLoop, readable from any task.
   volatile NtripState _state = NtripState::DISCONNECTED;
@@ -172,6 +175,9 @@ private:
   NtripStats _stats;
   SemaphoreHandle_t statsMutex = nullptr;
 
+  // Binary semaphore the task parks on while LOCKED_OUT.
+  SemaphoreHandle_t wakeSem = nullptr;
+
 #if NTRIP_CLIENT_ENABLE_TASK
   TaskHandle_t _taskHandle = nullptr;
 #endif
@@ -2,6 +2,7 @@
 #include "RtcmParser.h"
 #include <base64.h>
 #include <stdarg.h>
+#include <string.h>
 
 #define NTRIP_LOGE(...) logf(NtripLogLevel::Error, __VA_ARGS__)
 #define NTRIP_LOGW(...) logf(NtripLogLevel::Warning, __VA_ARGS__)
@@ -13,6 +14,51 @@ enum class StreamPhase { VALIDATION, STREAMING };
 // Local counters are flushed to shared stats at this cadence to reduce mutex contention.
 static constexpr unsigned long STATS_FLUSH_MS = 250;
 
+// Back-to-back reads allowed without the loop delay while the socket still has
+// a backlog (last read filled the buffer). Bounded so the idle task still runs.
+static constexpr uint8_t MAX_BURST_READS = 8;
+
+// HTTP/ICY status lines are short; longer lines are truncated for matching.
+static constexpr size_t STATUS_LINE_MAX = 128;
+
+static bool startsWith(const char* s, const char* prefix) {
+  return strncmp(s, prefix, strlen(prefix)) == 0;
+}
+
+// Build the full NTRIP request header block. The config is fixed after
+// begin(), so this runs once per protocol revision, not per connection.
+static String buildRequest(const NtripClientConfig& cfg, bool useRev2, const String& auth) {
+  String request;
+  request.reserve(192 + cfg.mount.length() + cfg.host.length() +
+                  auth.length() + cfg.ggaSentence.length());
+
+  request += "GET /";
+  request += cfg.mount;
+  request += useRev2 ? " HTTP/1.1\r\n" : " HTTP/1.0\r\n";
+
+  request += "User-Agent: NTRIP ESP32 v" NTRIP_CLIENT_VERSION "\r\n";
+
+  if (useRev2) {
+    request += "Host: ";
+    request += cfg.host;
+    request += "\r\n";
+    request += "Ntrip-Version: Ntrip/2.0\r\n";
+  }
+
+  request += "Authorization: Basic ";
+  request += auth;
+  request += "\r\n";
+
+  if (useRev2 && cfg.ggaSentence.length() > 0) {
+    request += "Ntrip-GGA: ";
+    request += cfg.ggaSentence;
+    request += "\r\n";
+  }
+
+  request += "\r\n";
+  return request;
+}
+
 // ─── Config validation ──────────────────────────────────────────────────────
 
 bool NtripClient::validateConfig(const NtripClientConfig& cfg, String& errorOut) {
@@ -36,6 +82,11 @@ bool NtripClient::begin(const NtripClientConfig& cfg, Print& gnss) {
   }
 
   config = cfg;
+  const String auth = base64::encode(cfg.user + ":" + cfg.pass);
+  requestRev2 = buildRequest(cfg, true, auth);
+#if NTRIP_CLIENT_ENABLE_REV1_FALLBACK
+  requestRev1 = buildRequest(cfg, false, auth);
+#endif
   gnssOutput = &gnss;
   failures = 0;
   _healthy = false;
@@ -51,6 +102,17 @@ bool NtripClient::begin(const NtripClientConfig& cfg, Print& gnss) {
     return false;
   }
 
+  // Wake semaphore for the LOCKED_OUT park — object-owned, so givers never
+  // touch the task handle. Cleared here so stale gives don't leak across begin().
+  if (wakeSem == nullptr) {
+    wakeSem = xSemaphoreCreateBinary();
+  }
+  if (wakeSem == nullptr) {
+    NTRIP_LOGE("Failed to create wake semaphore");
+    return false;
+  }
+  xSemaphoreTake(wakeSem, 0);
+
   _stats = NtripStats();
   NTRIP_LOGI("Initialized (v" NTRIP_CLIENT_VERSION ")");
   return true;
@@ -89,6 +151,7 @@ bool NtripClient::stopTask() {
   if (_taskHandle == nullptr) return false;
 
   _running = false;
+  wakeTask();
 
   // Wait for task to self-terminate.
   unsigned long start = millis();
@@ -143,8 +206,10 @@ void NtripClient::taskLoop() {
   uint16_t localLastMsgType = 0;
   unsigned long localLastFrameTime = 0;
   unsigned long lastStatsFlush = 0;
+  uint8_t burstReads = 0;
 
   while (_running) {
+    bool socketBacklog = false;
 
     // ── Close socket when not actively connected ─────────────────────────
     if (_state != NtripState::STREAMING && _state != NtripState::CONNECTING) {
@@ -219,6 +284,7 @@ void NtripClient::taskLoop() {
       }
 
       int n = client.read(buffer, config.bufferSize);
+      socketBacklog = n >= (int)config.bufferSize;
       if (n > 0) {
         localBytes += n;
 
@@ -289,7 +355,9 @@ void NtripClient::taskLoop() {
 
     // ── LOCKED_OUT: idle until user calls reset()/reconnect() ────────────
     if (_state == NtripState::LOCKED_OUT) {
-      vTaskDelay(pdMS_TO_TICKS(500));
+      // Park with no periodic wake-ups; reset(), reconnect() and stopTask()
+      // give wakeSem via wakeTask().
+      xSemaphoreTake(wakeSem, portMAX_DELAY);
       continue;
     }
 
@@ -315,6 +383,12 @@ void NtripClient::taskLoop() {
       }
     }
 
+    // Drain a socket backlog in a short burst instead of one read per tick.
+    if (socketBacklog && burstReads < MAX_BURST_READS) {
+      burstReads++;
+      continue;
+    }
+    burstReads = 0;
     vTaskDelay(pdMS_TO_TICKS(10));
   }
 
@@ -376,39 +450,8 @@ bool NtripClient::connectCasterWithVersion(const NtripClientConfig& cfg,
     return false;
   }
 
-  String auth = base64::encode(cfg.user + ":" + cfg.pass);
-
-  // Build NTRIP request
-  client.print("GET /");
-  client.print(cfg.mount);
-  if (useRev2) {
-    client.print(" HTTP/1.1\r\n");
-  } else {
-    client.print(" HTTP/1.0\r\n");
-  }
-
-  client.print("User-Agent: NTRIP ESP32 v");
-  client.print(NTRIP_CLIENT_VERSION);
-  client.print("\r\n");
-
-  if (useRev2) {
-    client.print("Host: ");
-    client.print(cfg.host);
-    client.print("\r\n");
-    client.print("Ntrip-Version: Ntrip/2.0\r\n");
-  }
-
-  client.print("Authorization: Basic ");
-  client.print(auth);
-  client.print("\r\n");
-
-  if (useRev2 && cfg.ggaSentence.length() > 0) {
-    client.print("Ntrip-GGA: ");
-    client.print(cfg.ggaSentence);
-    client.print("\r\n");
-  }
-
-  client.print("\r\n");
+  const String& request = useRev2 ? requestRev2 : requestRev1;
+  client.write(reinterpret_cast<const uint8_t*>(request.c_str()), request.length());
 
   // Wait for response
   unsigned long start = millis();
@@ -423,22 +466,36 @@ bool NtripClient::connectCasterWithVersion(const NtripClientConfig& cfg,
     return false;
   }
 
-  String line = client.readStringUntil('\n');
-  line.trim();
-
-  NTRIP_LOGI("Response: %s", line.c_str());
-
-  if (line.startsWith("ICY 200") || line.startsWith("HTTP/1.1 200") ||
-      line.startsWith("HTTP/1.0 200")) {
-    // Drain HTTP headers before binary stream begins
+  // Read the status line into a stack buffer and match it in place; a String
+  // is only built for the error message on the failure path.
+  char lineBuf[STATUS_LINE_MAX];
+  size_t len = client.readBytesUntil('\n', lineBuf, sizeof(lineBuf) - 1);
+  while (len > 0 && isspace((unsigned char)lineBuf[len - 1])) len--;
+  lineBuf[len] = '\0';
+  const char* line = lineBuf;
+  while (isspace((unsigned char)*line)) line++;
+
+  NTRIP_LOGI("Response: %s", line);
+
+  if (startsWith(line, "ICY 200") || startsWith(line, "HTTP/1.1 200") ||
+      startsWith(line, "HTTP/1.0 200")) {
+    // Drain HTTP headers before binary stream begins. Scan byte-by-byte for
+    // the blank line instead of building a String per header: no heap churn,
+    // and no bytes past the terminator are consumed from the RTCM stream.
+    bool lineHasContent = false;
     unsigned long drainStart = millis();
     while (millis() - drainStart < cfg.connectTimeoutMs) {
-      if (client.available()) {
-        String header = client.readStringUntil('\n');
-        header.trim();
-        if (header.length() == 0) {
-          NTRIP_LOGI("Headers drained, binary stream starting");
-          return true;
+      while (client.available() && millis() - drainStart < cfg.connectTimeoutMs) {
+        int c = client.read();
+        if (c < 0) break;
+        if (c == '\n') {
+          if (!lineHasContent) {
+            NTRIP_LOGI("Headers drained, binary stream starting");
+            return true;
+          }
+          lineHasContent = false;
+        } else if (c != '\r' && c != ' ' && c != '\t') {
+          lineHasContent = true;
         }
       }
       vTaskDelay(pdMS_TO_TICKS(10));
@@ -450,15 +507,15 @@ bool NtripClient::connectCasterWithVersion(const NtripClientConfig& cfg,
   // Parse specific HTTP errors
   client.stop();
 
-  if (line.indexOf("401") >= 0) {
+  if (strstr(line, "401") != nullptr) {
     err = NtripError::HTTP_AUTH_FAILED;
     errMsg = "Invalid credentials for " + cfg.host;
-  } else if (line.indexOf("404") >= 0) {
+  } else if (strstr(line, "404") != nullptr) {
     err = NtripError::HTTP_MOUNT_NOT_FOUND;
     errMsg = "Mount not found: " + cfg.mount;
   } else {
     err = NtripError::HTTP_UNKNOWN_ERROR;
-    errMsg = "HTTP error: " + line;
+    errMsg = String("HTTP error: ") + line;
   }
 
   return false;
@@ -539,15 +596,23 @@ void NtripClient::reset() {
     _stats.lastErrorMessage = "";
     xSemaphoreGive(statsMutex);
   }
+  wakeTask();
   NTRIP_LOGI("Reset — lockout cleared");
 }
 
 void NtripClient::reconnect() {
   disconnect();
   lastAttempt = 0;
+  wakeTask();
   NTRIP_LOGI("Reconnection requested");
 }
 
+void NtripClient::wakeTask() {
+  if (wakeSem != nullptr) {
+    xSemaphoreGive(wakeSem);
+  }
+}
+
 void NtripClient::setLogger(NtripLogFn logger) {
   logFn = logger;
 }